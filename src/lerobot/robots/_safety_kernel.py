@@ -0,0 +1,30 @@
+# JIT-compiled safety clamp shared by the robot hot paths.
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def clamp_safe(goal, present, cap, out):
+    """Clamp `goal` to within `cap` of `present`, writing into `out`.
+
+    All arguments are float32 1-D arrays of the same length. The explicit loop
+    beats NumPy for the ~12 joints of a bimanual setup because there is no
+    per-op dispatch, and njit compiles it to a branchless min/max clamp.
+    """
+    n = goal.shape[0]
+    for i in range(n):
+        d = goal[i] - present[i]
+        c = cap[i]
+        if d > c:
+            d = c
+        elif d < -c:
+            d = -c
+        out[i] = present[i] + d
+
+
+# Warm the JIT at import so the one-off compile (cached on disk afterwards)
+# never lands inside the 60 Hz control loop.
+_warmup = np.zeros(12, dtype=np.float32)
+clamp_safe(_warmup, _warmup, _warmup, _warmup)
+del _warmup
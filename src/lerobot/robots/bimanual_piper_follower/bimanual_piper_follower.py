@@ -1,11 +1,13 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from typing import Any
 
 from lerobot.cameras.utils import make_cameras_from_configs
 from lerobot.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
-from lerobot.robots.robot import Robot
 from lerobot.robots.piper.piper import Piper
+from lerobot.robots.robot import Robot
+
 from .config_bimanual_piper_follower import BimanualPiperFollowerConfig
 
 logger = logging.getLogger(__name__)
@@ -25,6 +27,13 @@ class BimanualPiperFollower(Robot):
         self.left_arm = Piper(config.left_arm)
         self.right_arm = Piper(config.right_arm)
         self.cameras = make_cameras_from_configs(config.cameras)
+        # The arms sit on independent CAN buses; driving them from a persistent
+        # pool overlaps the two I/O-bound SDK calls instead of serializing
+        # them. Recreated on reconnect since an executor cannot be reused
+        # after shutdown.
+        self._pool: ThreadPoolExecutor | None = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="bimanual_piper"
+        )
 
     @property
     def _motors_ft(self) -> dict[str, type]:
@@ -55,6 +64,9 @@ class BimanualPiperFollower(Robot):
         if self.is_connected:
             raise DeviceAlreadyConnectedError(f"{self} already connected")
 
+        if self._pool is None:
+            # disconnect() shuts the pool down; a reconnect needs a fresh one.
+            self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="bimanual_piper")
         self.left_arm.connect(calibrate=calibrate)
         self.right_arm.connect(calibrate=calibrate)
         for cam in self.cameras.values():
@@ -75,8 +87,10 @@ class BimanualPiperFollower(Robot):
         logger.info(f"{self} configured.")
 
     def get_observation(self) -> dict[str, Any]:
-        left_obs = self.left_arm.get_observation()
-        right_obs = self.right_arm.get_observation()
+        left_future = self._pool.submit(self.left_arm.get_observation)
+        right_future = self._pool.submit(self.right_arm.get_observation)
+        left_obs = left_future.result()
+        right_obs = right_future.result()
         combined_obs = {}
         for key, value in left_obs.items():
             combined_obs[f"left_{key}"] = value
@@ -100,15 +114,38 @@ class BimanualPiperFollower(Robot):
         if not right_action:
             logger.warning("Received action without right_ keys – right arm will not move.")
 
-        self.left_arm.send_action(left_action)
-        self.right_arm.send_action(right_action)
+        left_future = self._pool.submit(self.left_arm.send_action, left_action)
+        right_future = self._pool.submit(self.right_arm.send_action, right_action)
+        left_future.result()
+        right_future.result()
 
         return action
 
+    def send_action_array(self, arr) -> None:
+        """Send a 12-wide float32 action, left arm motors first, in leader order.
+
+        Array counterpart of send_action for the teleop fast path: no per-key
+        prefix split and no dict allocation per tick.
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+        left_future = self._pool.submit(self.left_arm.send_action_array, arr[:6])
+        right_future = self._pool.submit(self.right_arm.send_action_array, arr[6:])
+        left_future.result()
+        right_future.result()
+
+    def stop(self):
+        left_future = self._pool.submit(self.left_arm.stop)
+        right_future = self._pool.submit(self.right_arm.stop)
+        left_future.result()
+        right_future.result()
+
     def disconnect(self):
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
+        self._pool.shutdown(wait=True)
+        self._pool = None
         self.left_arm.disconnect()
         self.right_arm.disconnect()
         for cam in self.cameras.values():
@@ -6,18 +6,31 @@ from lerobot.cameras import CameraConfig
 
 
 @RobotConfig.register_subclass("bimanual_piper_follower")
-@dataclass
+@dataclass(slots=True)
 class BimanualPiperFollowerConfig(RobotConfig):
-    left_arm: PiperConfig = field(default_factory=lambda: PiperConfig(port="left_piper"))
-    right_arm: PiperConfig = field(default_factory=lambda: PiperConfig(port="right_piper"))
+    # None sentinels avoid constructing throwaway default PiperConfigs when the
+    # caller passes explicit arm configs.
+    left_arm: PiperConfig | None = None
+    right_arm: PiperConfig | None = None
     cameras: dict[str, CameraConfig] = field(default_factory=dict)
 
+    def __post_init__(self):
+        # Explicit base call: dataclass(slots=True) recreates the class, which
+        # breaks zero-argument super() in methods defined here.
+        RobotConfig.__post_init__(self)
+        if self.left_arm is None:
+            self.left_arm = PiperConfig(port="left_piper")
+        if self.right_arm is None:
+            self.right_arm = PiperConfig(port="right_piper")
+
 
 @RobotConfig.register_subclass("bimanual_piper_client")
-@dataclass
+@dataclass(slots=True)
 class BimanualPiperClientConfig(RobotConfig):
     # Network Configuration
     remote_ip: str
+    # "tcp" for remote hosts, "ipc" when host and client share a machine.
+    transport: str = "tcp"
     port_zmq_cmd: int = 5555
     port_zmq_observations: int = 5556
     cameras: dict[str, CameraConfig] = field(default_factory=dict)
@@ -5,9 +5,12 @@ from lerobot.cameras import CameraConfig
 from lerobot.robots.config import RobotConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class PiperHostConfig:
     # Network Configuration
+    # "tcp" for remote clients, "ipc" (unix socket) when host and client share a machine,
+    # which skips the kernel TCP stack entirely.
+    transport: str = "tcp"
     port_zmq_cmd: int = 5555
     port_zmq_observations: int = 5556
     # For how long the robot should stay in host mode.
@@ -19,13 +22,29 @@ class PiperHostConfig:
 
 
 @RobotConfig.register_subclass("piper_client")
-@dataclass
+@dataclass(slots=True)
 class PiperClientConfig(RobotConfig):
     # Network Configuration
     remote_ip: str
+    # "tcp" for remote hosts, "ipc" when host and client share a machine.
+    transport: str = "tcp"
     port_zmq_cmd: int = 5555
     port_zmq_observations: int = 5556
     cameras: dict[str, CameraConfig] = field(default_factory=dict)
 
     polling_timeout_ms: int = 15
-    connect_timeout_s: int = 5 
\ No newline at end of file
+    connect_timeout_s: int = 5
+
+
+def zmq_bind_locator(transport: str, port: int, channel: str) -> str:
+    """Build the host-side socket locator. `channel` disambiguates ipc paths."""
+    if transport == "ipc":
+        return f"ipc:///tmp/piper_{channel}_{port}"
+    return f"tcp://*:{port}"
+
+
+def zmq_connect_locator(transport: str, remote_ip: str, port: int, channel: str) -> str:
+    """Build the client-side socket locator, matching the host's bind locator for ipc."""
+    if transport == "ipc":
+        return f"ipc:///tmp/piper_{channel}_{port}"
+    return f"tcp://{remote_ip}:{port}" 
\ No newline at end of file
@@ -1,18 +1,43 @@
 # Implementation of Piper robot for LeRobot
 
+import logging
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
+import numpy as np
+
 from lerobot.cameras import CameraConfig, make_cameras_from_configs
-from lerobot.cameras.opencv import OpenCVCameraConfig
+from lerobot.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 from lerobot.robots import Robot, RobotConfig
 
 from .piper_sdk_interface import PiperSDKInterface
-from lerobot.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
+
+logger = logging.getLogger(__name__)
+
+# (leader key, follower fallback key) per joint, in SDK order. Teleop actions use
+# the leader names (e.g. `shoulder_pan.pos`), while stop() re-sends the follower's
+# own observation keys (`joint_N.pos`); joint 3 only exists under the fallback name.
+_JOINT_KEYS = (
+    ("shoulder_pan.pos", "joint_0.pos"),
+    ("shoulder_lift.pos", "joint_1.pos"),
+    ("elbow_flex.pos", "joint_2.pos"),
+    (None, "joint_3.pos"),
+    ("wrist_flex.pos", "joint_4.pos"),
+    ("wrist_roll.pos", "joint_5.pos"),
+    ("gripper.pos", "joint_6.pos"),
+)
+
+# SDK buffer slot per leader motor, in leader order (joint 3 has no leader
+# motor and stays 0 on the array path).
+_ARRAY_SLOTS = tuple(i for i, (primary, _) in enumerate(_JOINT_KEYS) if primary is not None)
 
 
 @RobotConfig.register_subclass("piper")
-@dataclass
+@dataclass(slots=True)
 class PiperConfig(RobotConfig):
     port: str
     cameras: dict[str, CameraConfig] = field(default_factory=dict)
@@ -30,20 +55,30 @@ class Piper(Robot):
         self.sdk = None
         self._is_connected = False
         self.cameras = make_cameras_from_configs(config.cameras)
-
-    @property
+        # Per-camera reader threads publish the latest frame into single-slot
+        # deques so get_observation never waits on a camera driver.
+        self._frame_buffers: dict[str, deque] = {}
+        self._camera_threads: list[threading.Thread] = []
+        self._camera_readers_running = False
+        # Reused every send_action call to avoid allocating a fresh positions
+        # list (and its PyFloats) per tick.
+        self._pos_buf = np.zeros(len(_JOINT_KEYS), dtype=np.float32)
+
+    # Features are invariant after construction; cached_property builds each
+    # dict on first access only, matching the PiperClient style.
+    @cached_property
     def _motors_ft(self) -> dict[str, type]:
         return {f"joint_{i}.pos": float for i in range(7)}
 
-    @property
+    @cached_property
     def _cameras_ft(self) -> dict[str, tuple]:
         return {cam: (self.cameras[cam].height, self.cameras[cam].width, 3) for cam in self.cameras}
 
-    @property
+    @cached_property
     def observation_features(self) -> dict:
         return {**self._motors_ft, **self._cameras_ft}
 
-    @property
+    @cached_property
     def action_features(self) -> dict:
         return self._motors_ft
 
@@ -58,11 +93,40 @@ class Piper(Robot):
         self._is_connected = True
         for cam in self.cameras.values():
             cam.connect()
+        self._camera_readers_running = True
+        for cam_key, cam in self.cameras.items():
+            buffer = deque(maxlen=1)
+            self._frame_buffers[cam_key] = buffer
+            thread = threading.Thread(
+                target=self._camera_reader_loop,
+                args=(cam, buffer),
+                daemon=True,
+                name=f"piper_camera_{cam_key}",
+            )
+            thread.start()
+            self._camera_threads.append(thread)
         self.configure()
 
+    def _camera_reader_loop(self, cam, buffer: deque) -> None:
+        # Cameras produce at their native FPS independently of the control loop;
+        # the single-slot deque keeps only the freshest frame (lock-free).
+        while self._camera_readers_running:
+            try:
+                buffer.append(cam.read())
+            except Exception as e:
+                logger.warning(f"Camera read failed: {e}")
+                # Back off before retrying so a dead camera (unplugged, driver
+                # error) doesn't peg a core and flood the log.
+                time.sleep(0.1)
+
     def disconnect(self) -> None:
         if not self._is_connected:
             return
+        self._camera_readers_running = False
+        for thread in self._camera_threads:
+            thread.join(timeout=1)
+        self._camera_threads.clear()
+        self._frame_buffers.clear()
         self.sdk.disconnect()
         for cam in self.cameras.values():
             cam.disconnect()
@@ -83,30 +147,46 @@ class Piper(Robot):
             raise DeviceNotConnectedError(f"{self} is not connected.")
         obs_dict = self.sdk.get_status()
 
-        for cam_key, cam in self.cameras.items():
-            obs_dict[cam_key] = cam.async_read()
+        for cam_key in self.cameras:
+            buffer = self._frame_buffers.get(cam_key)
+            if not buffer:
+                # No frame published yet (right after connect). Wait briefly
+                # for the reader thread instead of touching the camera from a
+                # second thread: async_read would spawn the camera's own
+                # reader loop, leaving two threads on the same capture device.
+                deadline = time.perf_counter() + 1.0
+                while not buffer and time.perf_counter() < deadline:
+                    time.sleep(0.001)
+                if not buffer:
+                    raise TimeoutError(f"No frame received from camera '{cam_key}' within 1 s.")
+            obs_dict[cam_key] = buffer[-1]
         return obs_dict
 
     def send_action(self, action: dict[str, Any]) -> dict[str, Any]:
         if not self._is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected.")
-        # map the action from the leader to joints for the follower
-        # This will handle both key styles.
-        # For teleop, action.get('shoulder_pan.pos') will work. For stop(), action.get('joint_0.pos') will work.
-        # The second get() acts as a fallback.
-        positions = [
-            action.get("shoulder_pan.pos", action.get("joint_0.pos", 0)),
-            action.get("shoulder_lift.pos", action.get("joint_1.pos", 0)),
-            action.get("elbow_flex.pos", action.get("joint_2.pos", 0)),
-            action.get("joint_3.pos", 0),
-            action.get("wrist_flex.pos", action.get("joint_4.pos", 0)),
-            action.get("wrist_roll.pos", action.get("joint_5.pos", 0)),
-            action.get("gripper.pos", action.get("joint_6.pos", 0)),
-        ]
+        # Map the action from the leader to joints for the follower, handling
+        # both key styles via the module-level table. Values land in the
+        # preallocated buffer instead of a new list.
+        positions = self._pos_buf
+        for i, (primary, fallback) in enumerate(_JOINT_KEYS):
+            positions[i] = (
+                action.get(primary, action.get(fallback, 0.0)) if primary else action.get(fallback, 0.0)
+            )
 
         self.sdk.set_joint_positions(positions)
         return action
 
+    def send_action_array(self, values) -> None:
+        """Send a 6-wide float32 action in leader motor order, skipping the dict path."""
+        if not self._is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+        positions = self._pos_buf
+        positions[3] = 0.0
+        for slot, value in zip(_ARRAY_SLOTS, values, strict=True):
+            positions[slot] = value
+        self.sdk.set_joint_positions(positions)
+
     def stop(self):
         if not self._is_connected:
             return
@@ -1,14 +1,19 @@
- 
-import json
+
 from functools import cached_property
 from typing import Any
 
+import msgpack
+import msgpack_numpy
 import zmq
 
 from lerobot.cameras import make_cameras_from_configs
-from lerobot.robots.piper.config_piper import PiperClientConfig
-from lerobot.robots.robot import Robot
 from lerobot.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
+from lerobot.robots.piper.config_piper import PiperClientConfig, zmq_connect_locator
+from lerobot.robots.piper.piper_transport import unpack_observation
+from lerobot.robots.robot import Robot
+
+# Make msgpack numpy-aware so camera frames travel as raw binary, not text.
+msgpack_numpy.patch()
 
 
 class PiperClient(Robot):
@@ -18,11 +23,13 @@ class PiperClient(Robot):
     def __init__(self, config: PiperClientConfig):
         super().__init__(config)
         self.remote_ip = config.remote_ip
+        self.transport = config.transport
         self.port_zmq_cmd = config.port_zmq_cmd
         self.port_zmq_observations = config.port_zmq_observations
         self.connect_timeout_s = config.connect_timeout_s
         self._is_connected = False
         self.cameras = make_cameras_from_configs(config.cameras)
+        self._motors_ft = {f"joint_{i}.pos": float for i in range(7)}
         self._cameras_ft = {cam: (self.cameras[cam].height, self.cameras[cam].width, 3) for cam in self.cameras}
 
     @cached_property
@@ -38,8 +45,7 @@ class PiperClient(Robot):
 
     @cached_property
     def observation_features(self) -> dict[str, type | tuple]:
-        motors_ft = {f"joint_{i}.pos": float for i in range(7)}
-        return {**motors_ft, **self._cameras_ft}
+        return {**self._motors_ft, **self._cameras_ft}
 
     @property
     def is_connected(self) -> bool:
@@ -51,18 +57,29 @@ class PiperClient(Robot):
             raise DeviceAlreadyConnectedError("Piper Daemon is already connected. Do not run `robot.connect()` twice.")
         self.zmq_context = zmq.Context()
         self.zmq_cmd_socket = self.zmq_context.socket(zmq.PUSH)
-        zmq_cmd_locator = f"tcp://{self.remote_ip}:{self.port_zmq_cmd}"
+        zmq_cmd_locator = zmq_connect_locator(self.transport, self.remote_ip, self.port_zmq_cmd, "cmd")
         self.zmq_cmd_socket.connect(zmq_cmd_locator)
+        # CONFLATE stays on the command socket only: it is incompatible with the
+        # multipart observation messages. A receive HWM of 1 keeps drop-stale
+        # semantics on the observation side.
         self.zmq_cmd_socket.setsockopt(zmq.CONFLATE, 1)
+        self.zmq_cmd_socket.setsockopt(zmq.LINGER, 0)
         self.zmq_observation_socket = self.zmq_context.socket(zmq.PULL)
-        zmq_observations_locator = f"tcp://{self.remote_ip}:{self.port_zmq_observations}"
+        self.zmq_observation_socket.setsockopt(zmq.RCVHWM, 1)
+        self.zmq_observation_socket.setsockopt(zmq.LINGER, 0)
+        zmq_observations_locator = zmq_connect_locator(
+            self.transport, self.remote_ip, self.port_zmq_observations, "obs"
+        )
         self.zmq_observation_socket.connect(zmq_observations_locator)
-        self.zmq_observation_socket.setsockopt(zmq.CONFLATE, 1)
         poller = zmq.Poller()
         poller.register(self.zmq_observation_socket, zmq.POLLIN)
         socks = dict(poller.poll(self.connect_timeout_s * 1000))
         if self.zmq_observation_socket not in socks or socks[self.zmq_observation_socket] != zmq.POLLIN:
             raise DeviceNotConnectedError("Timeout waiting for Piper Host to connect expired.")
+        # Pre-bind the send method and encoder so send_action resolves neither
+        # attribute per call on the 60 Hz path.
+        self._send_cmd = self.zmq_cmd_socket.send
+        self._packb = msgpack.packb
         self._is_connected = True
         for cam in self.cameras.values():
             cam.connect()
@@ -87,10 +104,14 @@ class PiperClient(Robot):
 
     def get_observation(self) -> dict[str, Any]:
         """Get an observation from the remote host."""
-        raw_obs = self.zmq_observation_socket.recv_string()
-        return json.loads(raw_obs)
+        parts = self.zmq_observation_socket.recv_multipart(copy=False)
+        return unpack_observation(parts)
 
     def send_action(self, action: dict[str, Any]) -> dict[str, Any]:
         """Send an action to the remote host."""
-        self.zmq_cmd_socket.send_string(json.dumps(action))
+        if type(action) is not dict:
+            # Lightweight mapping views (e.g. the bimanual leader's prefixed
+            # view) are materialized once here, at the serialization boundary.
+            action = dict(action)
+        self._send_cmd(self._packb(action, use_bin_type=True))
         return action 
\ No newline at end of file
@@ -1,15 +1,24 @@
 #!/usr/bin/env python
-import json
+import contextlib
 import logging
+import queue
+import threading
 import time
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 
 import draccus
+import msgpack
+import msgpack_numpy
 import zmq
 
 from lerobot.robots.config import RobotConfig
-from lerobot.robots.piper.config_piper import PiperHostConfig
+from lerobot.robots.piper.config_piper import PiperHostConfig, zmq_bind_locator
 from lerobot.robots.piper.piper import Piper
+from lerobot.robots.piper.piper_transport import pack_observation
+from lerobot.utils.robot_utils import precise_wait
+
+# Make msgpack numpy-aware so camera frames travel as raw binary, not text.
+msgpack_numpy.patch()
 
 
 @dataclass
@@ -21,19 +30,65 @@ class PiperHostScriptConfig:
 class PiperHost:
     def __init__(self, config: PiperHostConfig):
         self.zmq_context = zmq.Context()
+        # CONFLATE stays on the command socket only: it is incompatible with
+        # multipart messages, which the observation path needs for camera frames.
         self.zmq_cmd_socket = self.zmq_context.socket(zmq.PULL)
         self.zmq_cmd_socket.setsockopt(zmq.CONFLATE, 1)
-        self.zmq_cmd_socket.bind(f"tcp://*:{config.port_zmq_cmd}")
+        self.zmq_cmd_socket.setsockopt(zmq.LINGER, 0)
+        self.zmq_cmd_socket.bind(zmq_bind_locator(config.transport, config.port_zmq_cmd, "cmd"))
 
+        # A send HWM of 1 gives explicit drop-stale back-pressure on observations.
         self.zmq_observation_socket = self.zmq_context.socket(zmq.PUSH)
-        self.zmq_observation_socket.setsockopt(zmq.CONFLATE, 1)
-        self.zmq_observation_socket.bind(f"tcp://*:{config.port_zmq_observations}")
+        self.zmq_observation_socket.setsockopt(zmq.SNDHWM, 1)
+        self.zmq_observation_socket.setsockopt(zmq.LINGER, 0)
+        self.zmq_observation_socket.setsockopt(zmq.IMMEDIATE, 1)
+        self.zmq_observation_socket.bind(
+            zmq_bind_locator(config.transport, config.port_zmq_observations, "obs")
+        )
+
+        # Polling with a short timeout avoids constructing a zmq.Again exception
+        # on every idle iteration of the loop.
+        self.poller = zmq.Poller()
+        self.poller.register(self.zmq_cmd_socket, zmq.POLLIN)
 
         self.connection_time_s = config.connection_time_s
         self.watchdog_timeout_ms = config.watchdog_timeout_ms
         self.max_loop_freq_hz = config.max_loop_freq_hz
 
+        # Serialization and socket I/O run on a worker thread so a slow encode
+        # of a camera frame never stalls the control loop. The single-slot queue
+        # mirrors CONFLATE semantics: only the freshest observation is kept.
+        self._obs_queue = queue.Queue(maxsize=1)
+        self._obs_sender_running = True
+        self._obs_sender_thread = threading.Thread(target=self._observation_sender_loop, daemon=True)
+        self._obs_sender_thread.start()
+
+    def publish_observation(self, observation):
+        """Hand the latest observation to the sender thread, dropping any stale one."""
+        with contextlib.suppress(queue.Empty):
+            self._obs_queue.get_nowait()
+        self._obs_queue.put(observation)
+
+    def _observation_sender_loop(self):
+        while self._obs_sender_running:
+            try:
+                observation = self._obs_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            # Camera frames travel as separate zero-copy parts; only the scalar
+            # metadata goes through the encoder.
+            try:
+                self.zmq_observation_socket.send_multipart(
+                    pack_observation(observation), flags=zmq.NOBLOCK, copy=False
+                )
+            except zmq.Again:
+                logging.info("Dropping observation, no client connected")
+            except TypeError as e:
+                logging.error(f"Observation serialization failed: {e}")
+
     def disconnect(self):
+        self._obs_sender_running = False
+        self._obs_sender_thread.join(timeout=1)
         self.zmq_observation_socket.close()
         self.zmq_cmd_socket.close()
         self.zmq_context.term()
@@ -51,64 +106,72 @@ def main(cfg: PiperHostScriptConfig):
     host = PiperHost(cfg.host)
 
     first_command_received = False
-    last_cmd_time = time.time()
+    last_cmd_time = time.perf_counter()
     watchdog_active = False
     logging.info("Waiting for commands...")
+
+    # Pre-bind everything touched on every iteration so the 60 Hz loop does
+    # local loads instead of repeated attribute lookups.
+    perf_counter = time.perf_counter
+    poll = host.poller.poll
+    cmd_socket = host.zmq_cmd_socket
+    cmd_recv = cmd_socket.recv
+    unpackb = msgpack.unpackb
+    send_action = robot.send_action
+    get_observation = robot.get_observation
+    publish_observation = host.publish_observation
+    period = 1 / host.max_loop_freq_hz
+    watchdog_timeout_s = host.watchdog_timeout_ms / 1000
+
+    next_deadline = perf_counter() + period
     try:
         # Business logic
         while True:
-            loop_start_time = time.time()
-            try:
-                msg = host.zmq_cmd_socket.recv_string(zmq.NOBLOCK)
+            socks = dict(poll(timeout=2))
+            if cmd_socket in socks:
+                # Drain everything queued and only act on the freshest command,
+                # so the robot never replays stale commands if CONFLATE misses.
+                msg = None
+                while True:
+                    try:
+                        msg = cmd_recv(zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                try:
+                    if not first_command_received:
+                        logging.info("First command received. Starting teleoperation.")
+                        first_command_received = True
 
-                if not first_command_received:
-                    logging.info("First command received. Starting teleoperation.")
-                    first_command_received = True
+                    last_cmd_time = perf_counter()
+                    watchdog_active = False
 
-                last_cmd_time = time.time()
-                watchdog_active = False
+                    data = unpackb(msg, raw=False)
+                    _action_sent = send_action(data)
 
-                data = json.loads(msg)
-                _action_sent = robot.send_action(data)
+                except (ValueError, TypeError) as e:
+                    logging.error(f"Message parsing failed: {e}")
+                except Exception as e:
+                    logging.error(f"An unexpected error occurred: {e}")
 
-            except zmq.Again:
-                pass  # No command received yet, just continue waiting.
-            except (json.JSONDecodeError, TypeError) as e:
-                logging.error(f"Message parsing failed: {e}")
-            except Exception as e:
-                logging.error(f"An unexpected error occurred: {e}")
-
-            now = time.time()
-            if first_command_received and (now - last_cmd_time > 50000000) and not watchdog_active:
+            now = perf_counter()
+            if first_command_received and (now - last_cmd_time > watchdog_timeout_s) and not watchdog_active:
                 logging.warning(
                     f"Command not received for more than {host.watchdog_timeout_ms} milliseconds. Stopping the robot."
                 )
                 watchdog_active = True
                 robot.stop()
 
-            last_observation = robot.get_observation()
-            serializable_observation = {}
-            for key, value in last_observation.items():
-                try:
-                    json.dumps(value)
-                    serializable_observation[key] = value
-                except TypeError:
-                    serializable_observation[key] = str(value)
-
-            # Send the observation to the remote agent
-            try:
-                host.zmq_observation_socket.send_string(
-                    json.dumps(serializable_observation), flags=zmq.NOBLOCK
-                )
-            except zmq.Again:
-                logging.info("Dropping observation, no client connected")
-            except TypeError as e:
-                logging.error(f"Observation serialization failed: {e}")
-
-            # Ensure a short sleep to avoid overloading the CPU.
-            elapsed = time.time() - loop_start_time
-
-            time.sleep(max(1 / host.max_loop_freq_hz - elapsed, 0))
+            # Serialization and sending happen on the host's worker thread.
+            publish_observation(get_observation())
+
+            # Advance a fixed deadline so one slow frame is absorbed by the next
+            # instead of permanently dragging the average rate below target.
+            precise_wait(next_deadline)
+            next_deadline += period
+            if perf_counter() > next_deadline + period:
+                # Big slip (e.g. a blocked SDK call): resync rather than burst
+                # through the backlog of missed deadlines.
+                next_deadline = perf_counter() + period
 
     except KeyboardInterrupt:
         print("Keyboard interrupt received. Exiting...")
@@ -61,20 +61,19 @@ class PiperSDKInterface:
         gripper = self.piper.GetArmGripperMsgs()
         gripper.gripper_state.grippers_angle
 
+        # Cast to float at the source so every scalar in the observation matches
+        # the declared schema and downstream serialization never needs a
+        # per-key type probe or fallback.
         joint_state = joint_status.joint_state
         obs_dict = {
-            "joint_0.pos": joint_state.joint_1,
-            "joint_1.pos": joint_state.joint_2,
-            "joint_2.pos": joint_state.joint_3,
-            "joint_3.pos": joint_state.joint_4,
-            "joint_4.pos": joint_state.joint_5,
-            "joint_5.pos": joint_state.joint_6,
+            "joint_0.pos": float(joint_state.joint_1),
+            "joint_1.pos": float(joint_state.joint_2),
+            "joint_2.pos": float(joint_state.joint_3),
+            "joint_3.pos": float(joint_state.joint_4),
+            "joint_4.pos": float(joint_state.joint_5),
+            "joint_5.pos": float(joint_state.joint_6),
+            "joint_6.pos": float(gripper.gripper_state.grippers_angle),
         }
-        obs_dict.update(
-            {
-                "joint_6.pos": gripper.gripper_state.grippers_angle,
-            }
-        )
 
         return obs_dict
 
@@ -0,0 +1,49 @@
+# Wire format helpers shared by the Piper hosts and clients.
+
+import msgpack
+import msgpack_numpy
+import numpy as np
+
+msgpack_numpy.patch()
+
+
+def pack_observation(observation: dict) -> list:
+    """Split an observation into ZMQ multipart frames for zero-copy transport.
+
+    The first part is a msgpack dict with the scalar values and a header per
+    camera frame (name, shape, dtype); each subsequent part is the raw pixel
+    buffer of one frame. Sending the buffers with `copy=False` hands pointers
+    straight to libzmq, so pixel data never goes through an encoder.
+    """
+    scalars = {}
+    frame_headers = []
+    parts = [b""]
+    for key, value in observation.items():
+        if isinstance(value, np.ndarray):
+            arr = np.ascontiguousarray(value)
+            frame_headers.append((key, arr.shape, str(arr.dtype)))
+            parts.append(memoryview(arr))
+        else:
+            scalars[key] = value
+    # Scalars are typed floats by construction (see PiperSDKInterface.get_status),
+    # so no `default=` fallback is needed here.
+    parts[0] = msgpack.packb({"scalars": scalars, "frames": frame_headers}, use_bin_type=True)
+    return parts
+
+
+def unpack_observation(parts: list) -> dict:
+    """Rebuild an observation dict from the multipart frames of `pack_observation`.
+
+    Camera buffers are wrapped with `np.frombuffer`, so no pixel copy happens on
+    the receiving side either.
+    """
+    meta = msgpack.unpackb(_as_buffer(parts[0]), raw=False)
+    observation = meta["scalars"]
+    for (key, shape, dtype), frame in zip(meta["frames"], parts[1:], strict=True):
+        observation[key] = np.frombuffer(_as_buffer(frame), dtype=dtype).reshape(shape)
+    return observation
+
+
+def _as_buffer(part):
+    # recv_multipart(copy=False) yields zmq.Frame objects; recv_multipart() yields bytes.
+    return part.buffer if hasattr(part, "buffer") else part
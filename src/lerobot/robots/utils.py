@@ -13,9 +13,16 @@
 # limitations under the License.
 
 import logging
-from pprint import pformat
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+try:
+    from ._safety_kernel import clamp_safe
+except ImportError:
+    # numba unavailable: the NumPy clip below covers the same semantics.
+    clamp_safe = None
+
 if TYPE_CHECKING:
     from .config import RobotConfig
     from .robot import Robot
@@ -24,34 +31,36 @@ from lerobot.robots import RobotConfig
 
 from .robot import Robot
 
+# Lazily built lookup tables so repeated factory calls do an O(1) hash lookup
+# instead of a linear scan over Robot.__subclasses__().
+_ROBOT_BY_CONFIG: dict[type, type["Robot"]] = {}
+_ROBOT_BY_NAME: dict[str, type["Robot"]] = {}
 
-def make_robot_from_config(config: "RobotConfig") -> "Robot":  # noqa: F821
-    """Make a robot from a `RobotConfig` object."""
-    from .robot import Robot  # noqa: F801
-
-    logging.info(f"Attempting to create robot from config of type: {type(config)}")
-    logging.info(f"Config details: {config}")
 
-    subclasses = Robot.__subclasses__()
-    logging.info(f"Available Robot subclasses: {subclasses}")
+def _refresh_robot_registry() -> None:
+    from .robot import Robot  # noqa: F801
 
-    # This is the new way of instantiating robots.
-    for robot_cls in subclasses:
-        logging.info(f"Checking robot class: {robot_cls} with config_class: {getattr(robot_cls, 'config_class', None)}")
-        if getattr(robot_cls, "config_class", None) == config.__class__:
-            logging.info(f"Found matching robot class by config_class: {robot_cls}")
-            return robot_cls(config)
+    for robot_cls in Robot.__subclasses__():
+        config_class = getattr(robot_cls, "config_class", None)
+        if config_class is not None:
+            _ROBOT_BY_CONFIG.setdefault(config_class, robot_cls)
+        name = getattr(robot_cls, "name", None)
+        if name is not None:
+            _ROBOT_BY_NAME.setdefault(name, robot_cls)
 
-    # The following is for backward compatibility with the old way of defining robots.
-    # TODO(rcadene): remove this when all robots are migrated.
-    for robot_cls in subclasses:
-        logging.info(f"Checking robot class: {robot_cls} with name: {getattr(robot_cls, 'name', None)}")
-        if getattr(robot_cls, "name", None) == config.type:
-            logging.info(f"Found matching robot class by name: {robot_cls}")
-            return robot_cls(config)
 
-    logging.error(f"No matching robot class found for type: {config.type}")
-    raise ValueError(config.type)
+def make_robot_from_config(config: "RobotConfig") -> "Robot":  # noqa: F821
+    """Make a robot from a `RobotConfig` object."""
+    robot_cls = _ROBOT_BY_CONFIG.get(type(config)) or _ROBOT_BY_NAME.get(config.type)
+    if robot_cls is None:
+        # A subclass may have been imported since the last refresh.
+        _refresh_robot_registry()
+        robot_cls = _ROBOT_BY_CONFIG.get(type(config)) or _ROBOT_BY_NAME.get(config.type)
+    if robot_cls is None:
+        logging.error("No matching robot class found for type: %s", config.type)
+        raise ValueError(config.type)
+    logging.info("Creating robot %s from %s", robot_cls.__name__, type(config).__name__)
+    return robot_cls(config)
 
 
 def ensure_safe_goal_position(
@@ -59,34 +68,40 @@ def ensure_safe_goal_position(
 ) -> dict[str, float]:
     """Caps relative action target magnitude for safety."""
 
+    keys = list(goal_present_pos)
+    n = len(keys)
     if isinstance(max_relative_target, float):
-        diff_cap = dict.fromkeys(goal_present_pos, max_relative_target)
+        cap = np.full(n, max_relative_target, dtype=np.float32)
     elif isinstance(max_relative_target, dict):
-        if not set(goal_present_pos) == set(max_relative_target):
+        # dict_keys views compare with set semantics without building two sets.
+        if goal_present_pos.keys() != max_relative_target.keys():
             raise ValueError("max_relative_target keys must match those of goal_present_pos.")
-        diff_cap = max_relative_target
+        cap = np.fromiter((max_relative_target[key] for key in keys), dtype=np.float32, count=n)
     else:
         raise TypeError(max_relative_target)
 
-    warnings_dict = {}
-    safe_goal_positions = {}
-    for key, (goal_pos, present_pos) in goal_present_pos.items():
-        diff = goal_pos - present_pos
-        max_diff = diff_cap[key]
-        safe_diff = min(diff, max_diff)
-        safe_diff = max(safe_diff, -max_diff)
-        safe_goal_pos = present_pos + safe_diff
-        safe_goal_positions[key] = safe_goal_pos
-        if abs(safe_goal_pos - goal_pos) > 1e-4:
-            warnings_dict[key] = {
-                "original goal_pos": goal_pos,
-                "safe goal_pos": safe_goal_pos,
-            }
-
-    if warnings_dict:
+    # One vectorized clip over all joints instead of per-key Python arithmetic;
+    # this runs from send_action on every control tick.
+    goal_pos = np.fromiter((goal_present_pos[key][0] for key in keys), dtype=np.float32, count=n)
+    present_pos = np.fromiter((goal_present_pos[key][1] for key in keys), dtype=np.float32, count=n)
+    if clamp_safe is not None:
+        # The jitted loop beats np.clip at these joint counts (no per-op dispatch).
+        safe_pos = np.empty(n, dtype=np.float32)
+        clamp_safe(goal_pos, present_pos, cap, safe_pos)
+    else:
+        safe_pos = present_pos + np.clip(goal_pos - present_pos, -cap, cap)
+
+    clamped = np.abs(safe_pos - goal_pos) > 1e-4
+    if clamped.any():
+        # A flat joined line instead of pformat: under a stuck teleop this
+        # fires every tick, and pprint's repr/recursion machinery is overkill
+        # for a shallow dict.
         logging.warning(
-            "Relative goal position magnitude had to be clamped to be safe.\n"
-            f"{pformat(warnings_dict, indent=4)}"
+            "Relative goal position magnitude had to be clamped to be safe: %s",
+            ", ".join(
+                f"{keys[i]}: goal={goal_pos[i]:.3f} -> safe={safe_pos[i]:.3f}"
+                for i in np.flatnonzero(clamped)
+            ),
         )
 
-    return safe_goal_positions
+    return dict(zip(keys, safe_pos.tolist(), strict=True))
@@ -31,12 +31,14 @@ python -m lerobot.teleoperate \
 """
 
 import logging
+import sys
 import time
-from dataclasses import asdict, dataclass, field
-from pprint import pformat
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from pprint import pformat
 
 import draccus
+import numpy as np
 import rerun as rr
 
 from lerobot.cameras.opencv.configuration_opencv import OpenCVCameraConfig  # noqa: F401
@@ -51,6 +53,12 @@ from lerobot.robots import (  # noqa: F401
     so100_follower,
     so101_follower,
 )
+from lerobot.robots.bimanual_piper_follower.config_bimanual_piper_follower import (
+    BimanualPiperClientConfig,
+    BimanualPiperFollowerConfig,
+)
+from lerobot.robots.piper.piper import PiperConfig
+from lerobot.robots.piper.piper_client import PiperClientConfig
 from lerobot.teleoperators import (  # noqa: F401
     Teleoperator,
     TeleoperatorConfig,
@@ -61,14 +69,11 @@ from lerobot.teleoperators import (  # noqa: F401
     so100_leader,
     so101_leader,
 )
-from lerobot.utils.robot_utils import busy_wait
-from lerobot.utils.utils import init_logging, move_cursor_up
-from lerobot.utils.visualization_utils import _init_rerun, log_rerun_data
-from lerobot.robots.bimanual_piper_follower.config_bimanual_piper_follower import BimanualPiperFollowerConfig, BimanualPiperClientConfig
 from lerobot.teleoperators.bimanual_so101_leader.config_bimanual_so101_leader import BimanualSO101LeaderConfig
-from lerobot.robots.piper.piper import PiperConfig
-from lerobot.robots.piper.piper_client import PiperClientConfig
 from lerobot.teleoperators.so101_leader.config_so101_leader import SO101LeaderConfig
+from lerobot.utils.robot_utils import precise_wait
+from lerobot.utils.utils import init_logging, move_cursor_up
+from lerobot.utils.visualization_utils import _init_rerun, log_rerun_data
 
 
 @dataclass
@@ -108,50 +113,116 @@ class TeleoperateConfig:
     display_data: bool = False
 
 
+# Refresh the terminal display at most this often; the control loop itself
+# runs at the full `fps`.
+RENDER_INTERVAL_S = 0.1
+
+# Sample observations for visualization at camera rate, not control rate:
+# grabbing 30 fps frames at 60 Hz just moves the same pixels twice.
+OBS_INTERVAL_S = 1 / 30
+
+
 def teleop_loop(
     teleop: Teleoperator, robot: Robot, fps: int, display_data: bool = False, duration: int | None = None
 ):
-    display_len = max(len(key) for key in robot.action_features)
-    start = time.perf_counter()
+    # Read action_features once: bimanual robots rebuild the dict per access.
+    action_features = robot.action_features
+    display_len = max(len(key) for key in action_features)
+    # The header and per-motor format never change; build them once so each
+    # render is a single buffered stdout write instead of one print per motor.
+    header = "\n" + "-" * (display_len + 10) + "\n" + f"{'NAME':<{display_len}} | {'NORM':>7}\n"
+    row_fmt = f"{{:<{display_len}}} | {{:>7.2f}}\n"
+    # The action key set is static; format its preview once for the DEBUG log
+    # instead of allocating list(action.keys()) every tick.
+    keys_preview = ", ".join(list(action_features)[:10])
+    if len(action_features) > 10:
+        keys_preview += f", ... total {len(action_features)} keys"
+    last_render = 0.0
+    last_obs = 0.0
+    # Pre-bind everything touched on every iteration so the 60 Hz loop does
+    # local loads instead of repeated attribute lookups.
+    perf_counter = time.perf_counter
+    wait = precise_wait
+    period = 1 / fps
+    # Fast path: when both ends expose the fixed-order float32 array API
+    # (bimanual leader -> bimanual follower), the tick reuses one preallocated
+    # buffer and never crosses a dict boundary.
+    use_array = hasattr(teleop, "get_action_array") and hasattr(robot, "send_action_array")
+    if use_array:
+        # The buffer layout is the teleop's column order: the leader only
+        # emits motors it physically has (12 for the bimanual pair), while the
+        # robot may expose extra follower-only joints (e.g. Piper's joint 3)
+        # that the array path leaves at their defaults.
+        feature_names = tuple(teleop.action_features)
+        action_buf = np.empty(len(feature_names), dtype=np.float32)
+        get_action_array = teleop.get_action_array
+        send_action_array = robot.send_action_array
+    else:
+        get_action = teleop.get_action
+        send_action = robot.send_action
+    start = perf_counter()
     while True:
-        loop_start = time.perf_counter()
-        action = teleop.get_action()
-        if not action:
-            print("Waiting for teleoperator data...")
-            busy_wait(1 / fps)
-            continue
-        if display_data:
+        loop_start = perf_counter()
+        if use_array:
+            get_action_array(action_buf)
+            action = None
+        else:
+            action = get_action()
+            if not action:
+                print("Waiting for teleoperator data...")
+                wait(loop_start + period)
+                continue
+        if display_data and loop_start - last_obs >= OBS_INTERVAL_S and rr.is_enabled():
+            if action is None:
+                # Materialize a dict only on these 30 Hz visualization ticks.
+                action = dict(zip(feature_names, action_buf.tolist(), strict=True))
             observation = robot.get_observation()
             log_rerun_data(observation, action)
+            last_obs = loop_start
+
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Action keys: %s", keys_preview)
 
-        # Debug print of action keys each loop
-        if len(action) < 10:
-            print(f"DEBUG Action keys: {list(action.keys())}")
+        if use_array:
+            send_action_array(action_buf)
         else:
-            print(f"DEBUG Action keys: {list(action.keys())[:10]} ... total {len(action)} keys")
+            send_action(action)
+        # Sleep for the bulk of the interval and only spin the last few hundred
+        # microseconds, leaving the core free for the per-arm reader threads.
+        wait(loop_start + period)
 
-        robot.send_action(action)
-        dt_s = time.perf_counter() - loop_start
-        busy_wait(1 / fps - dt_s)
+        loop_s = perf_counter() - loop_start
 
-        loop_s = time.perf_counter() - loop_start
+        if loop_start - last_render > RENDER_INTERVAL_S:
+            rows = len(feature_names) if action is None else len(action)
+            items = zip(feature_names, action_buf, strict=True) if action is None else action.items()
+            buf = (
+                header
+                + "".join(row_fmt.format(motor, value) for motor, value in items)
+                + f"\ntime: {loop_s * 1e3:.2f}ms ({1 / loop_s:.0f} Hz)\n"
+            )
+            sys.stdout.write(buf)
+            sys.stdout.flush()
+            last_render = loop_start
 
-        print("\n" + "-" * (display_len + 10))
-        print(f"{'NAME':<{display_len}} | {'NORM':>7}")
-        for motor, value in action.items():
-            print(f"{motor:<{display_len}} | {value:>7.2f}")
-        print(f"\ntime: {loop_s * 1e3:.2f}ms ({1 / loop_s:.0f} Hz)")
+            if duration is not None and perf_counter() - start >= duration:
+                return
 
-        if duration is not None and time.perf_counter() - start >= duration:
+            # Move up by what was just printed: the teleop's action can have
+            # fewer keys than the robot's feature set (e.g. SO101 leader
+            # driving a Piper), and overshooting corrupts the terminal.
+            move_cursor_up(rows + 5)
+        elif duration is not None and perf_counter() - start >= duration:
             return
 
-        move_cursor_up(len(action) + 5)
-
 
 @draccus.wrap()
 def teleoperate(cfg: TeleoperateConfig):
     init_logging()
-    logging.info(pformat(asdict(cfg)))
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        # asdict recursively copies the whole config tree; skip it when the
+        # line would be dropped anyway.
+        logging.info(pformat(asdict(cfg)))
     if cfg.display_data:
         _init_rerun(session_name="teleoperation")
 
@@ -2,10 +2,24 @@ from .config import TeleoperatorConfig
 from .teleoperator import Teleoperator
 from .utils import make_teleoperator_from_config
 
-# Import teleoperator modules to register them
-from . import gamepad
-from . import homunculus
-from . import koch_leader
-from . import so100_leader
-from . import so101_leader
-from . import bimanual_so101_leader
+# Teleoperator modules register themselves on import but pull in heavy
+# serial/USB dependencies, so they are loaded lazily (PEP 562): only the
+# module actually accessed (or needed by the factory) gets imported.
+_LAZY = {
+    "gamepad",
+    "homunculus",
+    "koch_leader",
+    "so100_leader",
+    "so101_leader",
+    "bimanual_so101_leader",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,57 @@
 import logging
-from typing import Any
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import replace
+from typing import Any
 
 from lerobot.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
-from lerobot.teleoperators.teleoperator import Teleoperator
 from lerobot.teleoperators.so101_leader.so101_leader import SO101Leader
+from lerobot.teleoperators.teleoperator import Teleoperator
+
 from .config_bimanual_so101_leader import BimanualSO101LeaderConfig
 
 logger = logging.getLogger(__name__)
 
 
+class _PrefixedMapping(Mapping):
+    """Read-only view combining two per-arm dicts under left_/right_ prefixes.
+
+    Avoids building a fresh combined dict per control tick; consumers iterate
+    the view directly, and anything that truly needs a dict can materialize it
+    once with `dict(action)`.
+    """
+
+    __slots__ = ("_left", "_right", "_left_pairs", "_right_pairs")
+
+    def __init__(self, left, right, left_pairs, right_pairs):
+        self._left = left
+        self._right = right
+        self._left_pairs = left_pairs
+        self._right_pairs = right_pairs
+
+    def __getitem__(self, key):
+        if key[:5] == "left_":
+            return self._left[key[5:]]
+        if key[:6] == "right_":
+            return self._right[key[6:]]
+        raise KeyError(key)
+
+    def __iter__(self):
+        for _, prefixed_key in self._left_pairs:
+            yield prefixed_key
+        for _, prefixed_key in self._right_pairs:
+            yield prefixed_key
+
+    def __len__(self):
+        return len(self._left) + len(self._right)
+
+    def items(self):
+        for key, prefixed_key in self._left_pairs:
+            yield prefixed_key, self._left[key]
+        for key, prefixed_key in self._right_pairs:
+            yield prefixed_key, self._right[key]
+
+
 class BimanualSO101Leader(Teleoperator):
     """
     A bimanual teleoperator composed of two SO101 leader arms.
@@ -37,16 +79,39 @@ class BimanualSO101Leader(Teleoperator):
         self.left_arm = SO101Leader(left_cfg)
         self.right_arm = SO101Leader(right_cfg)
 
+        # Each arm sits on its own USB serial port, so per-arm calls are
+        # latency-bound and can be issued concurrently. Recreated on reconnect
+        # since an executor cannot be reused after shutdown.
+        self._pool: ThreadPoolExecutor | None = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="bimanual_leader"
+        )
+
+        # Lazily built caches: the feature set and the (arm key, prefixed key)
+        # layout are invariant while connected, so get_action only assigns
+        # values instead of rebuilding prefixed key strings at 60 Hz.
+        self._combined_features: dict[str, type] | None = None
+        self._left_pairs: tuple[tuple[str, str], ...] = ()
+        self._right_pairs: tuple[tuple[str, str], ...] = ()
+
+        # Connection/calibration state mirrors the arms but is held as plain
+        # bools: chaining to the arms can hit the serial bus on every check.
+        self._connected = False
+        self._calibrated = False
+
     @property
     def action_features(self) -> dict[str, type]:
-        left_action_features = self.left_arm.action_features
-        right_action_features = self.right_arm.action_features
-        combined_action_features = {}
-        for key in left_action_features:
-            combined_action_features[f"left_{key}"] = left_action_features[key]
-        for key in right_action_features:
-            combined_action_features[f"right_{key}"] = right_action_features[key]
-        return combined_action_features
+        if self._combined_features is None:
+            left_action_features = self.left_arm.action_features
+            right_action_features = self.right_arm.action_features
+            combined_action_features = {}
+            for key in left_action_features:
+                combined_action_features[f"left_{key}"] = left_action_features[key]
+            for key in right_action_features:
+                combined_action_features[f"right_{key}"] = right_action_features[key]
+            self._combined_features = combined_action_features
+            self._left_pairs = tuple((key, f"left_{key}") for key in left_action_features)
+            self._right_pairs = tuple((key, f"right_{key}") for key in right_action_features)
+        return self._combined_features
 
     @property
     def feedback_features(self) -> dict:
@@ -54,53 +119,108 @@ class BimanualSO101Leader(Teleoperator):
 
     @property
     def is_connected(self) -> bool:
-        return self.left_arm.is_connected and self.right_arm.is_connected
+        return self._connected
 
     def connect(self, calibrate: bool = True) -> None:
         if self.is_connected:
             raise DeviceAlreadyConnectedError(f"{self} already connected")
 
-        self.left_arm.connect(calibrate=calibrate)
-        self.right_arm.connect(calibrate=calibrate)
+        if self._pool is None:
+            # disconnect() shuts the pool down; a reconnect needs a fresh one.
+            self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="bimanual_leader")
+        # Connect with calibrate=False so neither worker thread triggers the
+        # interactive calibration: its input() prompts would race for stdin.
+        left = self._pool.submit(self.left_arm.connect, calibrate=False)
+        right = self._pool.submit(self.right_arm.connect, calibrate=False)
+        left.result()
+        right.result()
+        if calibrate:
+            # One arm at a time, on this thread: mirrors SO101Leader.connect
+            # but keeps the prompts sequential.
+            if not self.left_arm.is_calibrated:
+                logger.info("\n=== Calibrating LEFT arm ===")
+                self.left_arm.calibrate()
+            if not self.right_arm.is_calibrated:
+                logger.info("\n=== Calibrating RIGHT arm ===")
+                self.right_arm.calibrate()
+        self._connected = True
+        self._calibrated = self.left_arm.is_calibrated and self.right_arm.is_calibrated
 
         logger.info(f"{self} connected.")
 
     @property
     def is_calibrated(self) -> bool:
-        return self.left_arm.is_calibrated and self.right_arm.is_calibrated
+        return self._calibrated
 
     def calibrate(self) -> None:
         logger.info("\n=== Calibrating LEFT arm ===")
         self.left_arm.calibrate()
         logger.info("\n=== LEFT arm calibration complete. Proceeding with RIGHT arm ===")
         self.right_arm.calibrate()
+        self._calibrated = True
         logger.info("\n=== Calibration completed for both arms ===")
 
     def configure(self) -> None:
-        self.left_arm.configure()
-        self.right_arm.configure()
-
-    def get_action(self) -> dict[str, Any]:
-        left_action = self.left_arm.get_action()
-        right_action = self.right_arm.get_action()
-        combined_action = {}
-        for key, value in left_action.items():
-            combined_action[f"left_{key}"] = value
-        for key, value in right_action.items():
-            combined_action[f"right_{key}"] = value
-        return combined_action
+        left = self._pool.submit(self.left_arm.configure)
+        right = self._pool.submit(self.right_arm.configure)
+        left.result()
+        right.result()
+
+    def get_action(self) -> Mapping[str, Any]:
+        if self._combined_features is None:
+            _ = self.action_features  # populate the key-pair cache
+        left = self._pool.submit(self.left_arm.get_action)
+        right = self._pool.submit(self.right_arm.get_action)
+        return _PrefixedMapping(left.result(), right.result(), self._left_pairs, self._right_pairs)
+
+    def get_action_array(self, out) -> None:
+        """Fill `out` (float32, left motors then right, in motor order) in place.
+
+        Array counterpart of get_action for the teleop fast path; the column
+        order matches action_features.
+        """
+        if self._combined_features is None:
+            _ = self.action_features  # populate the key-pair cache
+        left = self._pool.submit(self.left_arm.get_action)
+        right = self._pool.submit(self.right_arm.get_action)
+        left_action = left.result()
+        right_action = right.result()
+        i = 0
+        for key, _ in self._left_pairs:
+            out[i] = left_action[key]
+            i += 1
+        for key, _ in self._right_pairs:
+            out[i] = right_action[key]
+            i += 1
 
     def send_feedback(self, feedback: dict[str, Any]) -> None:
-        # Assuming feedback is prefixed with left_ or right_
-        left_feedback = {k.replace("left_", ""): v for k, v in feedback.items() if k.startswith("left_")}
-        right_feedback = {k.replace("right_", ""): v for k, v in feedback.items() if k.startswith("right_")}
-        self.left_arm.send_feedback(left_feedback)
-        self.right_arm.send_feedback(right_feedback)
+        # Single pass, slicing by known prefix length: str.replace would scan
+        # the whole key and mangle a motor name containing the prefix twice.
+        left_feedback = {}
+        right_feedback = {}
+        for key, value in feedback.items():
+            if key[:5] == "left_":
+                left_feedback[key[5:]] = value
+            elif key[:6] == "right_":
+                right_feedback[key[6:]] = value
+        left = self._pool.submit(self.left_arm.send_feedback, left_feedback)
+        right = self._pool.submit(self.right_arm.send_feedback, right_feedback)
+        left.result()
+        right.result()
 
     def disconnect(self) -> None:
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
-        self.left_arm.disconnect()
-        self.right_arm.disconnect()
+        left = self._pool.submit(self.left_arm.disconnect)
+        right = self._pool.submit(self.right_arm.disconnect)
+        left.result()
+        right.result()
+        self._pool.shutdown(wait=True)
+        self._pool = None
+        self._connected = False
+        self._calibrated = False
+        self._combined_features = None
+        self._left_pairs = ()
+        self._right_pairs = ()
         logger.info(f"{self} disconnected.") 
\ No newline at end of file
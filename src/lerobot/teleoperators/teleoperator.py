@@ -125,9 +125,10 @@ class Teleoperator(abc.ABC):
         Args:
             fpath (Path | None): Optional path to the calibration file. Defaults to `self.calibration_fpath`.
         """
+        from .utils import load_calibration
+
         fpath = self.calibration_fpath if fpath is None else fpath
-        with open(fpath) as f, draccus.config_type("json"):
-            self.calibration = draccus.load(dict[str, MotorCalibration], f)
+        self.calibration = load_calibration(fpath)
 
     def _save_calibration(self, fpath: Path | None = None) -> None:
         """
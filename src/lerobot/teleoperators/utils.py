@@ -13,31 +13,79 @@
 # limitations under the License.
 
 import logging
+import os
+from functools import lru_cache
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+import draccus
+
+from lerobot.motors.motors_bus import MotorCalibration
+
 if TYPE_CHECKING:
     from .config import TeleoperatorConfig
     from .teleoperator import Teleoperator
 
 
-def make_teleoperator_from_config(config: "TeleoperatorConfig") -> "Teleoperator":  # noqa: F821
-    """Make a teleoperator from a `TeleoperatorConfig` object."""
+@lru_cache(maxsize=8)
+def _parse_calibration_file(fpath: str, mtime: float) -> dict[str, MotorCalibration]:
+    with open(fpath) as f, draccus.config_type("json"):
+        return draccus.load(dict[str, MotorCalibration], f)
+
+
+def load_calibration(fpath: Path) -> dict[str, MotorCalibration]:
+    """Load a calibration file, reusing the parsed result across reconnects.
+
+    The cache is keyed on (path, mtime), so saving a fresh calibration
+    invalidates it naturally. A shallow copy is returned so one device
+    reassigning entries cannot leak into another sharing the same file.
+    """
+    fpath = str(fpath)
+    return dict(_parse_calibration_file(fpath, os.path.getmtime(fpath)))
+
+
+# Lazily built lookup tables so repeated factory calls do an O(1) hash lookup
+# instead of a linear scan over Teleoperator.__subclasses__().
+_TELEOP_BY_CONFIG: dict[type, type["Teleoperator"]] = {}
+_TELEOP_BY_NAME: dict[str, type["Teleoperator"]] = {}
+
+
+def _refresh_teleoperator_registry() -> None:
     from .teleoperator import Teleoperator
 
-    subclasses = Teleoperator.__subclasses__()
-    logging.info(f"Available Teleoperator subclasses: {subclasses}")
+    for teleop_cls in Teleoperator.__subclasses__():
+        config_class = getattr(teleop_cls, "config_class", None)
+        if config_class is not None:
+            _TELEOP_BY_CONFIG.setdefault(config_class, teleop_cls)
+        name = getattr(teleop_cls, "name", None)
+        if name is not None:
+            _TELEOP_BY_NAME.setdefault(name, teleop_cls)
+
 
-    for teleop_cls in subclasses:
-        logging.info(f"Checking teleop class: {teleop_cls} with config_class: {getattr(teleop_cls, 'config_class', None)}")
-        if getattr(teleop_cls, "config_class", None) == config.__class__:
-            logging.info(f"Found matching teleop class by config_class: {teleop_cls}")
-            return teleop_cls(config)
+def _import_lazy_teleoperators() -> None:
+    import importlib
 
-    for teleop_cls in subclasses:
-        logging.info(f"Checking teleop class: {teleop_cls} with name: {getattr(teleop_cls, 'name', None)}")
-        if getattr(teleop_cls, "name", None) == config.type:
-            logging.info(f"Found matching teleop class by name: {teleop_cls}")
-            return teleop_cls(config)
+    from . import _LAZY
 
-    logging.error(f"No matching teleop class found for type: {config.type}")
-    raise ValueError(config.type)
+    for name in _LAZY:
+        importlib.import_module(f".{name}", __package__)
+
+
+def make_teleoperator_from_config(config: "TeleoperatorConfig") -> "Teleoperator":  # noqa: F821
+    """Make a teleoperator from a `TeleoperatorConfig` object."""
+    teleop_cls = _TELEOP_BY_CONFIG.get(type(config)) or _TELEOP_BY_NAME.get(config.type)
+    if teleop_cls is None:
+        # A subclass may have been imported since the last refresh.
+        _refresh_teleoperator_registry()
+        teleop_cls = _TELEOP_BY_CONFIG.get(type(config)) or _TELEOP_BY_NAME.get(config.type)
+    if teleop_cls is None:
+        # Last resort: the package imports teleoperator modules lazily, so the
+        # requested class may simply not be loaded yet.
+        _import_lazy_teleoperators()
+        _refresh_teleoperator_registry()
+        teleop_cls = _TELEOP_BY_CONFIG.get(type(config)) or _TELEOP_BY_NAME.get(config.type)
+    if teleop_cls is None:
+        logging.error("No matching teleop class found for type: %s", config.type)
+        raise ValueError(config.type)
+    logging.info("Creating teleoperator %s from %s", teleop_cls.__name__, type(config).__name__)
+    return teleop_cls(config)
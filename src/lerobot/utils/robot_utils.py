@@ -30,6 +30,21 @@ def busy_wait(seconds):
             time.sleep(seconds)
 
 
+def precise_wait(deadline: float, spin_s: float = 200e-6):
+    """Wait until `deadline` (a `time.perf_counter` timestamp).
+
+    Sleeps in the kernel for the bulk of the interval, then spins for the last
+    `spin_s` seconds. This gives sub-millisecond wake-up accuracy without
+    burning a full CPU core the way a pure spin-wait does.
+    """
+    while True:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return
+        if remaining > spin_s + 1e-3:
+            time.sleep(remaining - 1e-3)
+
+
 def safe_disconnect(func):
     # TODO(aliberts): Allow to pass custom exceptions
     # (e.g. ThreadServiceExit, KeyboardInterrupt, SystemExit, UnpluggedError, DynamixelCommError)
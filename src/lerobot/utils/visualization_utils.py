@@ -18,6 +18,16 @@ from typing import Any
 import numpy as np
 import rerun as rr
 
+# Newer rerun SDKs can log all scalar series of a tick as one batched message;
+# fall back to per-key rr.Scalar calls on older versions.
+_SCALARS = getattr(rr, "Scalars", None)
+_SERIES_LINES = getattr(rr, "SeriesLines", None)
+
+# Entity paths and series registrations are invariant per session; cache them
+# so the 60 Hz logging path does no f-string rebuilding.
+_path_cache: dict[tuple[str, str], str] = {}
+_named_series: set[str] = set()
+
 
 def _init_rerun(session_name: str = "lerobot_control_loop") -> None:
     """Initializes the Rerun SDK for visualizing the control loop."""
@@ -28,19 +38,55 @@ def _init_rerun(session_name: str = "lerobot_control_loop") -> None:
     rr.spawn(memory_limit=memory_limit)
 
 
-def log_rerun_data(observation: dict[str | Any], action: dict[str | Any]):
-    for obs, val in observation.items():
+def _entity_path(prefix: str, key: str) -> str:
+    path = _path_cache.get((prefix, key))
+    if path is None:
+        path = f"{prefix}.{key}"
+        _path_cache[(prefix, key)] = path
+    return path
+
+
+def _log_group_batched(prefix: str, values: dict[str, Any]) -> None:
+    """Log all scalars of one group as a single rr.Scalars batch."""
+    path = _entity_path(prefix, "scalars")
+    register = path not in _named_series and _SERIES_LINES is not None
+    names = [] if register else None
+    scalars = []
+    for key, val in values.items():
         if isinstance(val, float):
-            rr.log(f"observation.{obs}", rr.Scalar(val))
+            scalars.append(val)
+            if register:
+                names.append(key)
         elif isinstance(val, np.ndarray):
             if val.ndim == 1:
-                for i, v in enumerate(val):
-                    rr.log(f"observation.{obs}_{i}", rr.Scalar(float(v)))
+                scalars.extend(float(v) for v in val)
+                if register:
+                    names.extend(f"{key}_{i}" for i in range(len(val)))
             else:
-                rr.log(f"observation.{obs}", rr.Image(val), static=True)
-    for act, val in action.items():
+                rr.log(_entity_path(prefix, key), rr.Image(val), static=True)
+    if scalars:
+        if register:
+            rr.log(path, _SERIES_LINES(names=names), static=True)
+            _named_series.add(path)
+        rr.log(path, _SCALARS(scalars))
+
+
+def _log_group_per_key(prefix: str, values: dict[str, Any]) -> None:
+    for key, val in values.items():
         if isinstance(val, float):
-            rr.log(f"action.{act}", rr.Scalar(val))
+            rr.log(_entity_path(prefix, key), rr.Scalar(val))
         elif isinstance(val, np.ndarray):
-            for i, v in enumerate(val):
-                rr.log(f"action.{act}_{i}", rr.Scalar(float(v)))
+            if val.ndim == 1:
+                for i, v in enumerate(val):
+                    rr.log(f"{prefix}.{key}_{i}", rr.Scalar(float(v)))
+            else:
+                rr.log(_entity_path(prefix, key), rr.Image(val), static=True)
+
+
+def log_rerun_data(observation: dict[str | Any], action: dict[str | Any]):
+    if _SCALARS is not None:
+        _log_group_batched("observation", observation)
+        _log_group_batched("action", action)
+    else:
+        _log_group_per_key("observation", observation)
+        _log_group_per_key("action", action)
@@ -0,0 +1,39 @@
+import pytest
+
+from lerobot.robots.utils import ensure_safe_goal_position
+
+
+def test_within_cap_passes_through():
+    goal_present = {"joint_0.pos": (10.0, 9.5), "joint_1.pos": (-4.0, -3.8)}
+    safe = ensure_safe_goal_position(goal_present, 1.0)
+    assert safe == pytest.approx({"joint_0.pos": 10.0, "joint_1.pos": -4.0})
+
+
+def test_float_cap_clamps_both_directions():
+    goal_present = {"joint_0.pos": (20.0, 10.0), "joint_1.pos": (0.0, 10.0)}
+    safe = ensure_safe_goal_position(goal_present, 2.0)
+    assert safe == pytest.approx({"joint_0.pos": 12.0, "joint_1.pos": 8.0})
+
+
+def test_dict_cap_applies_per_key():
+    goal_present = {"joint_0.pos": (20.0, 10.0), "joint_1.pos": (20.0, 10.0)}
+    safe = ensure_safe_goal_position(goal_present, {"joint_0.pos": 1.0, "joint_1.pos": 5.0})
+    assert safe == pytest.approx({"joint_0.pos": 11.0, "joint_1.pos": 15.0})
+
+
+def test_dict_cap_with_mismatched_keys_raises():
+    goal_present = {"joint_0.pos": (20.0, 10.0)}
+    with pytest.raises(ValueError):
+        ensure_safe_goal_position(goal_present, {"joint_1.pos": 1.0})
+
+
+def test_invalid_cap_type_raises():
+    with pytest.raises(TypeError):
+        ensure_safe_goal_position({"joint_0.pos": (1.0, 0.0)}, "1.0")
+
+
+def test_returns_plain_floats_in_input_order():
+    goal_present = {"joint_1.pos": (5.0, 0.0), "joint_0.pos": (-5.0, 0.0)}
+    safe = ensure_safe_goal_position(goal_present, 10.0)
+    assert list(safe) == ["joint_1.pos", "joint_0.pos"]
+    assert all(type(value) is float for value in safe.values())
@@ -0,0 +1,68 @@
+import msgpack
+import numpy as np
+import pytest
+
+from lerobot.robots.piper.piper_transport import pack_observation, unpack_observation
+
+
+def _sample_observation():
+    return {
+        "joint_0.pos": 12.5,
+        "joint_1.pos": -3.0,
+        "front": np.arange(2 * 3 * 3, dtype=np.uint8).reshape(2, 3, 3),
+        "wrist": np.linspace(0.0, 1.0, 12, dtype=np.float32).reshape(4, 3),
+    }
+
+
+def test_round_trip_preserves_scalars_and_frames():
+    observation = _sample_observation()
+    restored = unpack_observation(pack_observation(observation))
+
+    assert set(restored) == set(observation)
+    assert restored["joint_0.pos"] == 12.5
+    assert restored["joint_1.pos"] == -3.0
+    for key in ("front", "wrist"):
+        assert restored[key].shape == observation[key].shape
+        assert restored[key].dtype == observation[key].dtype
+        np.testing.assert_array_equal(restored[key], observation[key])
+
+
+def test_pack_emits_one_part_per_frame():
+    parts = pack_observation(_sample_observation())
+
+    # One msgpack header plus one raw buffer per camera frame.
+    assert len(parts) == 3
+    meta = msgpack.unpackb(bytes(parts[0]), raw=False)
+    assert [name for name, _, _ in meta["frames"]] == ["front", "wrist"]
+    assert meta["scalars"] == {"joint_0.pos": 12.5, "joint_1.pos": -3.0}
+
+
+def test_frame_parts_are_zero_copy_views():
+    arr = np.zeros((4, 4), dtype=np.uint8)
+    parts = pack_observation({"cam": arr})
+
+    # The pixel part must alias the original buffer, not a serialized copy.
+    assert isinstance(parts[1], memoryview)
+    assert np.shares_memory(np.frombuffer(parts[1], dtype=np.uint8), arr)
+
+
+def test_non_contiguous_frame_is_made_contiguous():
+    arr = np.arange(24, dtype=np.uint8).reshape(4, 6)[:, ::2]
+    assert not arr.flags["C_CONTIGUOUS"]
+
+    restored = unpack_observation(pack_observation({"cam": arr}))
+    np.testing.assert_array_equal(restored["cam"], arr)
+
+
+def test_unpack_accepts_plain_bytes_parts():
+    # recv_multipart() without copy=False yields bytes instead of zmq.Frame.
+    parts = [bytes(part) for part in pack_observation(_sample_observation())]
+    restored = unpack_observation(parts)
+    assert restored["joint_0.pos"] == 12.5
+    assert restored["front"].shape == (2, 3, 3)
+
+
+def test_unpack_rejects_mismatched_part_count():
+    parts = pack_observation(_sample_observation())
+    with pytest.raises(ValueError):
+        unpack_observation(parts[:-1])
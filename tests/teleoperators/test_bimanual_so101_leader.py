@@ -0,0 +1,53 @@
+import pytest
+
+from lerobot.teleoperators.bimanual_so101_leader.bimanual_so101_leader import _PrefixedMapping
+
+
+@pytest.fixture
+def view():
+    left = {"shoulder_pan.pos": 1.0, "gripper.pos": 2.0}
+    right = {"shoulder_pan.pos": 3.0, "gripper.pos": 4.0}
+    left_pairs = tuple((key, f"left_{key}") for key in left)
+    right_pairs = tuple((key, f"right_{key}") for key in right)
+    return _PrefixedMapping(left, right, left_pairs, right_pairs)
+
+
+def test_getitem_routes_by_prefix(view):
+    assert view["left_shoulder_pan.pos"] == 1.0
+    assert view["right_gripper.pos"] == 4.0
+
+
+def test_getitem_rejects_unprefixed_key(view):
+    with pytest.raises(KeyError):
+        view["shoulder_pan.pos"]
+
+
+def test_iteration_yields_left_then_right(view):
+    assert list(view) == [
+        "left_shoulder_pan.pos",
+        "left_gripper.pos",
+        "right_shoulder_pan.pos",
+        "right_gripper.pos",
+    ]
+    assert len(view) == 4
+
+
+def test_items_pairs_keys_with_arm_values(view):
+    assert dict(view.items()) == {
+        "left_shoulder_pan.pos": 1.0,
+        "left_gripper.pos": 2.0,
+        "right_shoulder_pan.pos": 3.0,
+        "right_gripper.pos": 4.0,
+    }
+
+
+def test_materializes_to_plain_dict(view):
+    materialized = dict(view)
+    assert materialized == dict(view.items())
+    assert type(materialized) is dict
+
+
+def test_mapping_protocol(view):
+    assert "left_gripper.pos" in view
+    assert "elbow_flex.pos" not in view
+    assert view.get("missing") is None
@@ -0,0 +1,68 @@
+import os
+
+import draccus
+import pytest
+
+from lerobot.motors.motors_bus import MotorCalibration
+from lerobot.teleoperators.utils import _parse_calibration_file, load_calibration
+
+
+def _write_calibration(fpath, homing_offset):
+    calibration = {
+        "shoulder_pan": MotorCalibration(
+            id=1, drive_mode=0, homing_offset=homing_offset, range_min=0, range_max=4095
+        ),
+    }
+    with open(fpath, "w") as f, draccus.config_type("json"):
+        draccus.dump(calibration, f, indent=4)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    _parse_calibration_file.cache_clear()
+
+
+def test_load_calibration_parses_file(tmp_path):
+    fpath = tmp_path / "leader.json"
+    _write_calibration(fpath, homing_offset=42)
+
+    calibration = load_calibration(fpath)
+    assert calibration["shoulder_pan"] == MotorCalibration(
+        id=1, drive_mode=0, homing_offset=42, range_min=0, range_max=4095
+    )
+
+
+def test_reload_with_same_mtime_hits_cache(tmp_path):
+    fpath = tmp_path / "leader.json"
+    _write_calibration(fpath, homing_offset=42)
+
+    load_calibration(fpath)
+    load_calibration(fpath)
+    assert _parse_calibration_file.cache_info().hits == 1
+    assert _parse_calibration_file.cache_info().misses == 1
+
+
+def test_mtime_change_invalidates_cache(tmp_path):
+    fpath = tmp_path / "leader.json"
+    _write_calibration(fpath, homing_offset=42)
+    load_calibration(fpath)
+
+    _write_calibration(fpath, homing_offset=7)
+    # Force a distinct mtime: a fast rewrite can land in the same timestamp.
+    os.utime(fpath, (os.path.getmtime(fpath) + 1, os.path.getmtime(fpath) + 1))
+
+    assert load_calibration(fpath)["shoulder_pan"].homing_offset == 7
+
+
+def test_returns_a_copy_per_call(tmp_path):
+    fpath = tmp_path / "leader.json"
+    _write_calibration(fpath, homing_offset=42)
+
+    first = load_calibration(fpath)
+    first["shoulder_pan"] = None
+    first["extra"] = "junk"
+
+    # Mutating one device's calibration must not poison the cached entry.
+    second = load_calibration(fpath)
+    assert second["shoulder_pan"].homing_offset == 42
+    assert "extra" not in second
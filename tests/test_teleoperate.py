@@ -0,0 +1,85 @@
+import numpy as np
+
+from lerobot.teleoperate import teleop_loop
+
+_MOTORS = ("shoulder_pan", "shoulder_lift", "elbow_flex", "wrist_flex", "wrist_roll", "gripper")
+
+
+class _StubBimanualLeader:
+    """Leader exposing the array fast path with 12 motors (6 per arm)."""
+
+    action_features = {
+        f"{side}_{motor}.pos": float for side in ("left", "right") for motor in _MOTORS
+    }
+
+    def get_action_array(self, out) -> None:
+        out[:] = np.arange(len(out), dtype=np.float32)
+
+
+class _StubBimanualFollower:
+    """Follower exposing 14 action keys (7 per arm, including the leader-less joint 3)."""
+
+    action_features = {f"{side}_joint_{i}.pos": float for side in ("left", "right") for i in range(7)}
+
+    def __init__(self):
+        self.sent = []
+
+    def send_action_array(self, arr) -> None:
+        self.sent.append(np.array(arr, copy=True))
+
+
+def test_array_fast_path_sizes_buffer_from_teleop(capsys):
+    teleop = _StubBimanualLeader()
+    robot = _StubBimanualFollower()
+
+    teleop_loop(teleop, robot, fps=1000, display_data=False, duration=0)
+
+    # The buffer must match the leader's 12 motors, not the follower's 14
+    # features: the follower's array API expects left/right halves of the
+    # leader layout and fills follower-only joints itself.
+    assert len(robot.sent) == 1
+    np.testing.assert_array_equal(robot.sent[0], np.arange(12, dtype=np.float32))
+
+    # The rendered table labels rows with the teleop's keys.
+    out = capsys.readouterr().out
+    for key in teleop.action_features:
+        assert key in out
+
+
+class _StubLeader:
+    """Dict-path leader with fewer motors than the robot has features."""
+
+    action_features = {f"{motor}.pos": float for motor in _MOTORS}
+
+    def get_action(self):
+        return dict.fromkeys(self.action_features, 0.0)
+
+
+class _StubPiper:
+    """Dict-path robot exposing one more feature (joint 3) than the leader."""
+
+    action_features = {f"joint_{i}.pos": float for i in range(7)}
+
+    def __init__(self):
+        self.sent = []
+
+    def send_action(self, action):
+        self.sent.append(dict(action))
+        return action
+
+
+def test_dict_path_moves_cursor_by_rendered_rows(capsys):
+    teleop = _StubLeader()
+    robot = _StubPiper()
+
+    # Long enough for at least one render plus one more tick, so the cursor
+    # reset after the table is actually exercised.
+    teleop_loop(teleop, robot, fps=200, display_data=False, duration=0.05)
+
+    assert robot.sent and all(len(action) == 6 for action in robot.sent)
+
+    # 6 action rows + 5 frame lines: the cursor must move up by what was
+    # printed, not by the robot's 7-key feature count.
+    out = capsys.readouterr().out
+    assert "\033[11A" in out
+    assert "\033[12A" not in out